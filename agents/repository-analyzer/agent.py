@@ -1,19 +1,17 @@
 # agent.py
-from hyperon import MeTTa
-from uagents import Context, Model, Protocol, Agent
+import asyncio
+from uagents import Context, Protocol, Agent
 from uagents_core.contrib.protocols.chat import (
     ChatAcknowledgement,
     ChatMessage,
     TextContent,
     chat_protocol_spec,
 )
-import os
-from datetime import datetime
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 
 # Import MeTTa components
-from metta.knowledge import initialize_knowledge_graph
-from metta.reporag import RepoRAG
+from metta.knowledge import get_rag
 from metta.utils import fetch_github_repo, analyze_file_structure, analyze_with_metta, format_repo_response
 
 # Import protocols
@@ -31,14 +29,24 @@ agent = Agent(
     publish_agent_details=True
 )
 
-# Initialize global MeTTa components
-metta = MeTTa()
-initialize_knowledge_graph(metta)
-rag = RepoRAG(metta)
+# Shared MeTTa knowledge graph (also used by the repository protocol)
+rag = get_rag()
 
 # Protocol setup
 chat_proto = Protocol(spec=chat_protocol_spec)
 
+INVALID_FORMAT_TEXT = "❌ Invalid format. Please use: `owner/repo`\n\nExample: `facebook/react`"
+
+
+def _reply(msg: ChatMessage, text: str) -> ChatMessage:
+    """Build a single-text chat reply to msg."""
+    return ChatMessage(
+        content=[TextContent(text=text)],
+        timestamp=datetime.now(timezone.utc),
+        msg_id=msg.msg_id
+    )
+
+
 @chat_proto.on_message(ChatMessage)
 async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
     """Handle incoming chat messages and analyze GitHub repositories."""
@@ -50,38 +58,18 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
     )
 
     if not text_content:
-        await ctx.send(
-            sender,
-            ChatMessage(
-                content=[
-                    TextContent(text="❌ No text content found in message.")
-                ],
-                timestamp=datetime.now(),
-                msg_id=msg.msg_id
-            )
-        )
+        await ctx.send(sender, _reply(msg, "❌ No text content found in message."))
         return
 
     user_message = text_content.text.strip()
 
-    ctx.logger.info(f"Analyzing repository: {user_message}")
+    ctx.logger.info("Analyzing repository: %s", user_message)
 
     # Parse owner/repo from input (format: "owner/repo" or "analyze owner/repo")
     repo_input = user_message.lower().replace("analyze", "").strip()
 
     if "/" not in repo_input:
-        await ctx.send(
-            sender,
-            ChatMessage(
-                content=[
-                    TextContent(
-                        text="❌ Invalid format. Please use: `owner/repo`\n\nExample: `facebook/react`"
-                    )
-                ],
-                timestamp=datetime.now(),
-                msg_id=msg.msg_id
-            )
-        )
+        await ctx.send(sender, _reply(msg, INVALID_FORMAT_TEXT))
         return
 
     try:
@@ -89,20 +77,11 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
         owner = owner.strip()
         repo = repo.strip()
 
-        # Fetch GitHub repo data
-        repo_data = fetch_github_repo(owner, repo)
+        # Fetch GitHub repo data off the event loop so other messages keep being served
+        repo_data = await asyncio.to_thread(fetch_github_repo, owner, repo)
 
         if "error" in repo_data:
-            await ctx.send(
-                sender,
-                ChatMessage(
-                    content=[
-                        TextContent(text=format_repo_response(repo_data, {}))
-                    ],
-                    timestamp=datetime.now(),
-                    msg_id=msg.msg_id
-                )
-            )
+            await ctx.send(sender, _reply(msg, format_repo_response(repo_data, {})))
             return
 
         # Analyze file structure
@@ -116,16 +95,7 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
         response_text = format_repo_response(repo_data, file_analysis)
 
         # Send response
-        await ctx.send(
-            sender,
-            ChatMessage(
-                content=[
-                    TextContent(text=response_text)
-                ],
-                timestamp=datetime.now(),
-                msg_id=msg.msg_id
-            )
-        )
+        await ctx.send(sender, _reply(msg, response_text))
 
         # Send acknowledgement
         await ctx.send(
@@ -137,35 +107,15 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
         )
 
     except ValueError:
-        await ctx.send(
-            sender,
-            ChatMessage(
-                content=[
-                    TextContent(
-                        text="❌ Invalid format. Please use: `owner/repo`\n\nExample: `facebook/react`"
-                    )
-                ],
-                timestamp=datetime.now(),
-                msg_id=msg.msg_id
-            )
-        )
+        await ctx.send(sender, _reply(msg, INVALID_FORMAT_TEXT))
     except Exception as e:
-        ctx.logger.error(f"Error analyzing repository: {e}")
-        await ctx.send(
-            sender,
-            ChatMessage(
-                content=[
-                    TextContent(text=f"❌ Error analyzing repository: {str(e)}")
-                ],
-                timestamp=datetime.now(),
-                msg_id=msg.msg_id
-            )
-        )
+        ctx.logger.error("Error analyzing repository: %s", e)
+        await ctx.send(sender, _reply(msg, f"❌ Error analyzing repository: {str(e)}"))
 
 @chat_proto.on_message(ChatAcknowledgement)
 async def handle_ack(ctx: Context, sender: str, msg: ChatAcknowledgement):
     """Handle acknowledgements."""
-    ctx.logger.info(f"Received acknowledgement from {sender}: {msg.ack_type}")
+    ctx.logger.info("Received acknowledgement from %s: %s", sender, msg.ack_type)
 
 # Register protocols
 agent.include(chat_proto, publish_manifest=True)  # For chat interface (ASI-1, frontend)
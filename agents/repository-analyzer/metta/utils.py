@@ -1,68 +1,232 @@
 # utils.py
+import logging
 import requests
-from typing import Dict, Any, List
+from requests.adapters import HTTPAdapter
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
 import re
 
+logger = logging.getLogger(__name__)
+
+# Shared workers for the independent per-repo GitHub calls (five per fetch)
+GITHUB_EXECUTOR_WORKERS = 10
+_github_executor = ThreadPoolExecutor(max_workers=GITHUB_EXECUTOR_WORKERS, thread_name_prefix="github-fetch")
+
+# One keep-alive session for all GitHub API calls (a repo fetch makes six). The first call of
+# each fetch runs on the default executor (at most 32 threads, via asyncio.to_thread) and the
+# rest on _github_executor, so size the pool for both instead of requests' default of 10
+# kept-alive connections.
+_github_session = requests.Session()
+_github_session.headers.update({"Accept": "application/vnd.github.v3+json"})
+_github_session.mount("https://", HTTPAdapter(pool_maxsize=32 + GITHUB_EXECUTOR_WORKERS))
+
+# Recently fetched repositories: "owner/repo" (lowercased) → (fetched_at, repo_data),
+# least recently used first. Entries hold full recursive trees (tens of MB for large
+# monorepos), so keep only a few.
+REPO_CACHE_TTL_SECONDS = 300
+REPO_CACHE_MAX_ENTRIES = 16
+_repo_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_repo_cache_lock = threading.Lock()  # Handlers fetch from worker threads
+
+# Average lines per file type (conservative estimates)
+AVG_LOC_BY_EXTENSION = {
+    'py': 100,       # Python
+    'js': 80,        # JavaScript
+    'ts': 80,        # TypeScript
+    'jsx': 80,       # React
+    'tsx': 80,       # React TypeScript
+    'go': 120,       # Go
+    'rs': 100,       # Rust
+    'java': 150,     # Java
+    'kt': 100,       # Kotlin
+    'swift': 100,    # Swift
+    'cpp': 120,      # C++
+    'cc': 120,       # C++
+    'c': 100,        # C
+    'h': 50,         # Headers
+    'hpp': 50,       # C++ Headers
+    'rb': 90,        # Ruby
+    'php': 100,      # PHP
+    'cs': 120,       # C#
+    'sol': 80,       # Solidity
+    'vy': 80,        # Vyper
+    'sh': 50,        # Shell
+    'bash': 50,      # Bash
+    'yml': 30,       # YAML
+    'yaml': 30,      # YAML
+    'json': 20,      # JSON
+    'xml': 30,       # XML
+    'html': 50,      # HTML
+    'css': 50,       # CSS
+    'scss': 60,      # SCSS
+    'vue': 100,      # Vue
+    'md': 40,        # Markdown
+    'txt': 20,       # Text
+}
+
+# Source-code extensions counted as "code files" when computing the test ratio
+CODE_EXTENSIONS = frozenset({
+    'py', 'js', 'ts', 'jsx', 'tsx', 'go', 'rs', 'java', 'kt',
+    'swift', 'c', 'cpp', 'h', 'hpp', 'rb', 'php', 'cs', 'sol', 'vy',
+})
+
+
+def _compile_substring_matcher(patterns: List[str]) -> "re.Pattern":
+    """Compile literal substrings into one alternation so a path is scanned once."""
+    return re.compile('|'.join(re.escape(pattern) for pattern in patterns))
+
+
+# Project type detection (matched against lowercased file paths)
+API_PATH_MATCHER = _compile_substring_matcher(['/api/', '/routes/', '/endpoints/', '/controllers/', '/handlers/'])
+UI_PATH_MATCHER = _compile_substring_matcher(['/components/', '/views/', '/pages/', '/ui/', '/frontend/'])
+ML_PATH_MATCHER = _compile_substring_matcher(['/models/', '/train', '/dataset', 'ml/', 'tensorflow', 'pytorch'])
+BLOCKCHAIN_PATH_MATCHER = _compile_substring_matcher(['/contracts/', 'solidity', '.sol', 'web3', 'ethers'])
+
+# Test file detection (matched against lowercased file names / paths)
+TEST_NAME_MATCHER = _compile_substring_matcher([
+    'test_',      # test_*.py
+    '_test.',     # *_test.py, *_test.go
+    '.test.',     # *.test.js, *.test.ts
+    '.spec.',     # *.spec.js, *.spec.ts
+])
+# JUnit classes (*Test.java, *Tests.java), matched case-sensitively against the original file name
+JAVA_TEST_NAME_MATCHER = re.compile(r'Tests?\.java$')
+TEST_DIR_MATCHER = _compile_substring_matcher(['/test/', '/tests/', '/__tests__/', '/spec/', '/e2e/'])
+
+# CI/CD config locations (matched against lowercased file paths)
+CI_CONFIG_PATTERNS = (
+    '.github/workflows/',
+    '.gitlab-ci.yml',
+    '.circleci/config.yml',
+    '.travis.yml',
+    'jenkinsfile',
+    'azure-pipelines.yml',
+)
+
+# Framework detection patterns
+TEST_FRAMEWORK_FILES = {
+    'pytest': ['pytest.ini', 'pyproject.toml', 'conftest.py'],
+    'unittest': [],  # Python builtin
+    'jest': ['jest.config.js', 'jest.config.ts', 'jest.config.json'],
+    'mocha': ['.mocharc.js', '.mocharc.json', 'mocha.opts'],
+    'vitest': ['vitest.config.ts', 'vitest.config.js'],
+    'junit': ['pom.xml'],
+    'go test': ['go.mod'],
+    'cargo test': ['Cargo.toml'],
+    'rspec': ['.rspec'],
+    'phpunit': ['phpunit.xml'],
+}
+
+# Reverse index: lowercased config file name → framework
+TEST_FRAMEWORK_BY_CONFIG = {
+    config_file.lower(): framework
+    for framework, config_files in TEST_FRAMEWORK_FILES.items()
+    for config_file in config_files
+}
+
+# Scoring tables: (minimum value, result), ordered from the highest tier down
+CONTRIBUTOR_COUNT_POINTS: Tuple[Tuple[float, int], ...] = ((100, 50), (50, 40), (20, 30), (10, 20), (5, 10), (1, 5))
+COMMIT_RATE_POINTS: Tuple[Tuple[float, int], ...] = ((50, 50), (20, 40), (10, 30), (5, 20), (1, 10))
+DIFFICULTY_TIERS: Tuple[Tuple[float, str], ...] = ((85, "expert"), (60, "advanced"), (30, "intermediate"))
+QUALITY_RATINGS: Tuple[Tuple[float, str], ...] = ((80, "Excellent"), (60, "Good"), (40, "Fair"))
+
+
+def _lookup_tier(value: float, tiers: Tuple[Tuple[float, Any], ...], default: Any) -> Any:
+    """Return the result of the first tier whose minimum value reaches, else default."""
+    for minimum, result in tiers:
+        if value >= minimum:
+            return result
+    return default
+
+
+# Report emoji by complexity tier and by documentation / test coverage rating
+TIER_EMOJI = {"expert": "🔥", "advanced": "⚡", "intermediate": "⭐", "beginner": "🌱"}
+DOC_RATING_EMOJI = {"Excellent": "📚", "Good": "📖", "Fair": "📝", "Poor": "📄"}
+TEST_RATING_EMOJI = {"Excellent": "🧪", "Good": "🔬", "Fair": "⚗️", "Poor": "🧫"}
+
+
 def fetch_github_repo(owner: str, repo: str) -> Dict[str, Any]:
-    """Fetch GitHub repository data via API."""
+    """
+    Fetch GitHub repository data, reusing a recent fetch of the same repo.
+
+    Each fetch costs six GitHub API calls against the unauthenticated rate
+    limit, and the chat and inter-agent protocols often ask for the same repo
+    within minutes. Errors are never cached, and neither are degraded fetches
+    where a secondary call did not return 200 (e.g. 202 while GitHub is still
+    computing participation stats, or a 403 rate limit on the tree) - those
+    fall back to empty data, so the next request refetches instead.
+    """
+    cache_key = f"{owner}/{repo}".lower()
+    with _repo_cache_lock:
+        cached = _repo_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < REPO_CACHE_TTL_SECONDS:
+            _repo_cache.move_to_end(cache_key)
+            return dict(cached[1])  # Shallow copy: callers annotate the result
+
+    repo_data, complete = _fetch_github_repo_uncached(owner, repo)
+    if complete:
+        with _repo_cache_lock:
+            _repo_cache[cache_key] = (time.monotonic(), repo_data)
+            _repo_cache.move_to_end(cache_key)
+            if len(_repo_cache) > REPO_CACHE_MAX_ENTRIES:
+                _repo_cache.popitem(last=False)
+        return dict(repo_data)
+
+    return repo_data
+
+
+def _get_github_json(url: str, default: Any, missing_ok: bool = False) -> Tuple[bool, Any]:
+    """
+    GET a GitHub API URL and decode it, or use default on a non-200 status.
+
+    Returns (ok, data); ok is False when the call did not return 200, unless
+    missing_ok and the resource legitimately does not exist (404).
+    """
+    response = _github_session.get(url, timeout=10)
+    if response.status_code == 200:
+        return True, response.json()
+    return missing_ok and response.status_code == 404, default
+
+
+def _fetch_github_repo_uncached(owner: str, repo: str) -> Tuple[Dict[str, Any], bool]:
+    """Fetch GitHub repository data via API; returns (repo_data, complete)."""
     try:
         # Fetch repo data
-        repo_response = requests.get(
+        repo_response = _github_session.get(
             f"https://api.github.com/repos/{owner}/{repo}",
-            headers={"Accept": "application/vnd.github.v3+json"},
             timeout=10
         )
 
         if repo_response.status_code != 200:
-            return {"error": f"Failed to fetch repo: {repo_response.status_code}"}
+            return {"error": f"Failed to fetch repo: {repo_response.status_code}"}, False
 
         repo_data = repo_response.json()
 
-        # Fetch languages
-        languages_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/languages",
-            headers={"Accept": "application/vnd.github.v3+json"},
-            timeout=10
+        # The remaining calls only need the repo response, so run them concurrently
+        base_url = f"https://api.github.com/repos/{owner}/{repo}"
+        languages_future = _github_executor.submit(_get_github_json, f"{base_url}/languages", {})
+        # File tree (recursive)
+        tree_future = _github_executor.submit(
+            _get_github_json, f"{base_url}/git/trees/{repo_data['default_branch']}?recursive=1", {}
         )
-
-        languages_data = languages_response.json() if languages_response.status_code == 200 else {}
-
-        # Fetch file tree (top level)
-        tree_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/git/trees/{repo_data['default_branch']}?recursive=1",
-            headers={"Accept": "application/vnd.github.v3+json"},
-            timeout=10
-        )
-
-        tree_data = tree_response.json() if tree_response.status_code == 200 else {}
-
-        # Fetch README
-        readme_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/readme",
-            headers={"Accept": "application/vnd.github.v3+json"},
-            timeout=10
-        )
-
-        readme_data = readme_response.json() if readme_response.status_code == 200 else {}
-
-        # Fetch contributors (first page only - 30 contributors max to avoid rate limits)
-        contributors_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/contributors?per_page=30",
-            headers={"Accept": "application/vnd.github.v3+json"},
-            timeout=10
-        )
-
-        contributors_data = contributors_response.json() if contributors_response.status_code == 200 else []
+        # README (a repo without one answers 404, which is a complete answer)
+        readme_future = _github_executor.submit(_get_github_json, f"{base_url}/readme", {}, True)
+        # Contributors (first page only - 30 contributors max to avoid rate limits)
+        contributors_future = _github_executor.submit(_get_github_json, f"{base_url}/contributors?per_page=30", [])
+        # Commit activity (last 52 weeks)
+        participation_future = _github_executor.submit(_get_github_json, f"{base_url}/stats/participation", {})
+
+        languages_ok, languages_data = languages_future.result()
+        tree_ok, tree_data = tree_future.result()
+        readme_ok, readme_data = readme_future.result()
+        contributors_ok, contributors_data = contributors_future.result()
         contributors_count = len(contributors_data) if isinstance(contributors_data, list) else 0
+        participation_ok, participation_data = participation_future.result()
 
-        # Fetch commit activity (last 52 weeks)
-        participation_response = requests.get(
-            f"https://api.github.com/repos/{owner}/{repo}/stats/participation",
-            headers={"Accept": "application/vnd.github.v3+json"},
-            timeout=10
-        )
-
-        participation_data = participation_response.json() if participation_response.status_code == 200 else {}
+        complete = languages_ok and tree_ok and readme_ok and contributors_ok and participation_ok
 
         return {
             "name": repo_data['name'],
@@ -82,10 +246,10 @@ def fetch_github_repo(owner: str, repo: str) -> Dict[str, Any]:
             "repo_url": repo_data['html_url'],
             "contributors_count": contributors_count,
             "commit_activity": participation_data.get('all', [])  # Commits per week (52 weeks)
-        }
+        }, complete
 
     except Exception as e:
-        return {"error": str(e)}
+        return {"error": str(e)}, False
 
 
 def calculate_loc_from_files(tree: List[Dict]) -> int:
@@ -93,64 +257,27 @@ def calculate_loc_from_files(tree: List[Dict]) -> int:
     Calculate estimated LOC based on file extensions.
     Uses average LOC per extension similar to Code Index MCP approach.
     """
-    # Average lines per file type (conservative estimates)
-    avg_loc_by_ext = {
-        'py': 100,       # Python
-        'js': 80,        # JavaScript
-        'ts': 80,        # TypeScript
-        'jsx': 80,       # React
-        'tsx': 80,       # React TypeScript
-        'go': 120,       # Go
-        'rs': 100,       # Rust
-        'java': 150,     # Java
-        'kt': 100,       # Kotlin
-        'swift': 100,    # Swift
-        'cpp': 120,      # C++
-        'cc': 120,       # C++
-        'c': 100,        # C
-        'h': 50,         # Headers
-        'hpp': 50,       # C++ Headers
-        'rb': 90,        # Ruby
-        'php': 100,      # PHP
-        'cs': 120,       # C#
-        'sol': 80,       # Solidity
-        'vy': 80,        # Vyper
-        'sh': 50,        # Shell
-        'bash': 50,      # Bash
-        'yml': 30,       # YAML
-        'yaml': 30,      # YAML
-        'json': 20,      # JSON
-        'xml': 30,       # XML
-        'html': 50,      # HTML
-        'css': 50,       # CSS
-        'scss': 60,      # SCSS
-        'vue': 100,      # Vue
-        'md': 40,        # Markdown
-        'txt': 20,       # Text
-    }
-
     total_loc = 0
     code_file_count = 0
-    ext_breakdown = {}
+    ext_counts = {}  # LOC per extension is count × average, so only counts are kept
 
     for item in tree:
         if item['type'] == 'blob':
             path = item['path']
             if '.' in path:
                 ext = path.split('.')[-1].lower()
-                if ext in avg_loc_by_ext:
-                    loc = avg_loc_by_ext[ext]
-                    total_loc += loc
+                if ext in AVG_LOC_BY_EXTENSION:
+                    total_loc += AVG_LOC_BY_EXTENSION[ext]
                     code_file_count += 1
-                    ext_breakdown[ext] = ext_breakdown.get(ext, {'count': 0, 'loc': 0})
-                    ext_breakdown[ext]['count'] += 1
-                    ext_breakdown[ext]['loc'] += loc
+                    ext_counts[ext] = ext_counts.get(ext, 0) + 1
 
-    print(f"[DEBUG LOC] Total code files: {code_file_count}")
-    print(f"[DEBUG LOC] Extension breakdown:")
-    for ext, data in sorted(ext_breakdown.items(), key=lambda x: x[1]['loc'], reverse=True):
-        print(f"  - .{ext}: {data['count']} files × {avg_loc_by_ext[ext]} avg = {data['loc']} LOC")
-    print(f"[DEBUG LOC] Total estimated LOC: {total_loc:,}")
+    # Breakdown is debug-only; skip building it unless debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[LOC] Total code files: %d", code_file_count)
+        logger.debug("[LOC] Extension breakdown:")
+        for ext, count in sorted(ext_counts.items(), key=lambda x: x[1] * AVG_LOC_BY_EXTENSION[x[0]], reverse=True):
+            logger.debug("  - .%s: %d files × %d avg = %d LOC", ext, count, AVG_LOC_BY_EXTENSION[ext], count * AVG_LOC_BY_EXTENSION[ext])
+        logger.debug("[LOC] Total estimated LOC: %s", f"{total_loc:,}")
 
     return total_loc
 
@@ -177,12 +304,6 @@ def analyze_file_structure(tree: List[Dict]) -> Dict[str, Any]:
             "build.gradle": None
         }
 
-        # Pattern detection
-        api_patterns = ['/api/', '/routes/', '/endpoints/', '/controllers/', '/handlers/']
-        ui_patterns = ['/components/', '/views/', '/pages/', '/ui/', '/frontend/']
-        ml_patterns = ['/models/', '/train', '/dataset', 'ml/', 'tensorflow', 'pytorch']
-        blockchain_patterns = ['/contracts/', 'solidity', '.sol', 'web3', 'ethers']
-
         for item in tree:
             if item['type'] == 'blob':  # file
                 file_count += 1
@@ -200,14 +321,15 @@ def analyze_file_structure(tree: List[Dict]) -> Dict[str, Any]:
                     if path.endswith(config_file):
                         config_files[config_file] = path
 
-                # Pattern detection
-                if any(pattern in path.lower() for pattern in api_patterns):
+                # Pattern detection (skip groups that already matched)
+                path_lower = path.lower()
+                if not has_api and API_PATH_MATCHER.search(path_lower):
                     has_api = True
-                if any(pattern in path.lower() for pattern in ui_patterns):
+                if not has_ui and UI_PATH_MATCHER.search(path_lower):
                     has_ui = True
-                if any(pattern in path.lower() for pattern in ml_patterns):
+                if not has_ml and ML_PATH_MATCHER.search(path_lower):
                     has_ml = True
-                if any(pattern in path.lower() for pattern in blockchain_patterns):
+                if not has_blockchain and BLOCKCHAIN_PATH_MATCHER.search(path_lower):
                     has_blockchain = True
 
         return {
@@ -222,7 +344,7 @@ def analyze_file_structure(tree: List[Dict]) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Error analyzing file structure: {e}")
+        logger.error("Error analyzing file structure: %s", e)
         return {}
 
 
@@ -273,10 +395,12 @@ def analyze_with_metta(repo_data: Dict[str, Any], file_analysis: Dict[str, Any],
         insights["project_type"] = project_type
         insights["reasoning"].append(f"Project type: {project_type}")
 
-        # Tech domains from languages
+        # Tech domains from languages (first language per domain wins)
+        seen_domains = set()
         for lang in repo_data.get("languages", {}).keys():
             domain = rag.get_language_domain(lang)
-            if domain not in insights["tech_domains"]:
+            if domain not in seen_domains:
+                seen_domains.add(domain)
                 insights["tech_domains"].append(domain)
                 insights["reasoning"].append(f"Tech domain: {lang} → {domain}")
 
@@ -291,22 +415,21 @@ def analyze_with_metta(repo_data: Dict[str, Any], file_analysis: Dict[str, Any],
         insights["reasoning"].append(f"Test Coverage: {test_analysis['coverage_rating']} ({test_analysis['test_file_count']} test files, {test_analysis['test_ratio']:.1%} ratio)")
 
         # Calculate weighted complexity score
+        contributors_count = repo_data.get('contributors_count', 0)
+        commit_activity = repo_data.get('commit_activity', [])
         complexity_result = calculate_complexity_score(
             loc=estimated_loc,
             file_count=file_count,
             test_analysis=test_analysis,
             doc_analysis=doc_analysis,
-            contributors_count=repo_data.get('contributors_count', 0),
-            commit_activity=repo_data.get('commit_activity', [])
+            contributors_count=contributors_count,
+            commit_activity=commit_activity
         )
 
         insights["complexity_score"] = complexity_result
         insights["difficulty_tier"] = complexity_result['tier']
 
         # Add reasoning about contributors
-        contributors_count = repo_data.get('contributors_count', 0)
-        commit_activity = repo_data.get('commit_activity', [])
-
         if contributors_count > 0 or commit_activity:
             contributor_info = f"Contributors: {contributors_count} developers"
             if commit_activity and len(commit_activity) >= 12:
@@ -320,7 +443,7 @@ def analyze_with_metta(repo_data: Dict[str, Any], file_analysis: Dict[str, Any],
         return insights
 
     except Exception as e:
-        print(f"MeTTa analysis error: {e}")
+        logger.error("MeTTa analysis error: %s", e)
         return insights
 
 
@@ -378,36 +501,15 @@ def calculate_complexity_score(
     contributor_score = 0
 
     # Contributor count (0-50 points)
-    if contributors_count >= 100:
-        contributor_score += 50
-    elif contributors_count >= 50:
-        contributor_score += 40
-    elif contributors_count >= 20:
-        contributor_score += 30
-    elif contributors_count >= 10:
-        contributor_score += 20
-    elif contributors_count >= 5:
-        contributor_score += 10
-    elif contributors_count > 0:
-        contributor_score += 5
+    contributor_score += _lookup_tier(contributors_count, CONTRIBUTOR_COUNT_POINTS, 0)
 
     # Commit activity (0-50 points) - average commits per week in last 12 weeks
     if commit_activity and len(commit_activity) >= 12:
         recent_commits = commit_activity[-12:]  # Last 12 weeks
         avg_commits_per_week = sum(recent_commits) / 12
 
-        if avg_commits_per_week >= 50:
-            contributor_score += 50
-        elif avg_commits_per_week >= 20:
-            contributor_score += 40
-        elif avg_commits_per_week >= 10:
-            contributor_score += 30
-        elif avg_commits_per_week >= 5:
-            contributor_score += 20
-        elif avg_commits_per_week >= 1:
-            contributor_score += 10
-        elif avg_commits_per_week > 0:
-            contributor_score += 5
+        # Any activity below one commit/week still earns 5 points
+        contributor_score += _lookup_tier(avg_commits_per_week, COMMIT_RATE_POINTS, 5 if avg_commits_per_week > 0 else 0)
 
     contributor_score = min(contributor_score, 100)  # Cap at 100
 
@@ -423,14 +525,7 @@ def calculate_complexity_score(
     final_score = min(100, max(0, int(final_score)))  # Clamp to 0-100
 
     # Determine tier
-    if final_score >= 85:
-        tier = "expert"
-    elif final_score >= 60:
-        tier = "advanced"
-    elif final_score >= 30:
-        tier = "intermediate"
-    else:
-        tier = "beginner"
+    tier = _lookup_tier(final_score, DIFFICULTY_TIERS, "beginner")
 
     return {
         'final_score': final_score,
@@ -467,85 +562,31 @@ def analyze_tests(tree: List[Dict]) -> Dict[str, Any]:
     frameworks = set()
     ci_configs = []
 
-    # Test file patterns
-    test_patterns = {
-        'name_patterns': [
-            'test_',      # test_*.py
-            '_test.',     # *_test.py, *_test.go
-            '.test.',     # *.test.js, *.test.ts
-            '.spec.',     # *.spec.js, *.spec.ts
-            'Test.java',  # *Test.java
-            'Tests.java', # *Tests.java
-        ],
-        'dir_patterns': [
-            '/test/',
-            '/tests/',
-            '/__tests__/',
-            '/spec/',
-            '/e2e/',
-        ]
-    }
-
-    # Framework detection patterns
-    framework_files = {
-        'pytest': ['pytest.ini', 'pyproject.toml', 'conftest.py'],
-        'unittest': [],  # Python builtin
-        'jest': ['jest.config.js', 'jest.config.ts', 'jest.config.json'],
-        'mocha': ['.mocharc.js', '.mocharc.json', 'mocha.opts'],
-        'vitest': ['vitest.config.ts', 'vitest.config.js'],
-        'junit': ['pom.xml'],
-        'go test': ['go.mod'],
-        'cargo test': ['Cargo.toml'],
-        'rspec': ['.rspec'],
-        'phpunit': ['phpunit.xml'],
-    }
-
-    # CI/CD patterns
-    ci_patterns = [
-        '.github/workflows/',
-        '.gitlab-ci.yml',
-        '.circleci/config.yml',
-        '.travis.yml',
-        'Jenkinsfile',
-        'azure-pipelines.yml',
-    ]
-
     # Analyze tree
     for item in tree:
         if item['type'] == 'blob':
+            original_name = item['path'].split('/')[-1]  # JUnit names are matched case-sensitively
             path = item['path'].lower()
-            name = path.split('/')[-1]
+            name = original_name.lower()
 
             # Check if it's a test file
-            is_test = False
-            for pattern in test_patterns['name_patterns']:
-                if pattern in name:
-                    is_test = True
-                    break
-
-            if not is_test:
-                for pattern in test_patterns['dir_patterns']:
-                    if pattern in path:
-                        is_test = True
-                        break
-
-            if is_test:
+            if (TEST_NAME_MATCHER.search(name)
+                    or TEST_DIR_MATCHER.search(path)
+                    or JAVA_TEST_NAME_MATCHER.search(original_name)):
                 test_files.append(item)
             else:
                 # Check if it's a code file (not config/docs)
                 ext = name.split('.')[-1] if '.' in name else ''
-                code_extensions = ['py', 'js', 'ts', 'jsx', 'tsx', 'go', 'rs', 'java', 'kt',
-                                 'swift', 'c', 'cpp', 'h', 'hpp', 'rb', 'php', 'cs', 'sol', 'vy']
-                if ext in code_extensions:
+                if ext in CODE_EXTENSIONS:
                     code_files.append(item)
 
             # Check for framework config files
-            for framework, config_files in framework_files.items():
-                if any(config_file in path for config_file in config_files):
-                    frameworks.add(framework)
+            framework = TEST_FRAMEWORK_BY_CONFIG.get(name)
+            if framework:
+                frameworks.add(framework)
 
             # Check for CI/CD
-            for ci_pattern in ci_patterns:
+            for ci_pattern in CI_CONFIG_PATTERNS:
                 if ci_pattern in path:
                     ci_configs.append(item['path'])
 
@@ -585,14 +626,7 @@ def analyze_tests(tree: List[Dict]) -> Dict[str, Any]:
         score += 20
 
     # Rating
-    if score >= 80:
-        rating = "Excellent"
-    elif score >= 60:
-        rating = "Good"
-    elif score >= 40:
-        rating = "Fair"
-    else:
-        rating = "Poor"
+    rating = _lookup_tier(score, QUALITY_RATINGS, "Poor")
 
     return {
         'test_file_count': test_count,
@@ -600,7 +634,7 @@ def analyze_tests(tree: List[Dict]) -> Dict[str, Any]:
         'test_ratio': round(test_ratio, 3),
         'coverage_score': score,
         'coverage_rating': rating,
-        'test_frameworks': sorted(list(frameworks)) if frameworks else [],
+        'test_frameworks': sorted(frameworks),
         'has_ci': len(ci_configs) > 0,
         'ci_configs': ci_configs,
     }
@@ -623,24 +657,32 @@ def analyze_documentation(tree: List[Dict]) -> Dict[str, Any]:
     score = 0
     details = {}
 
+    # Lowercase every path once; the helpers below scan the tree ~20 times
+    lowered_tree = [(item['path'].lower(), item) for item in tree]
+
+    # Index blobs by lowercased file name, keeping tree order within each name
+    files_by_name = {}
+    for path_lower, item in lowered_tree:
+        if item['type'] == 'blob':
+            files_by_name.setdefault(path_lower.rsplit('/', 1)[-1], []).append((path_lower, item))
+
     # Helper to find files (case-insensitive)
     def find_file(pattern: str) -> Dict:
         pattern_lower = pattern.lower()
-        for item in tree:
-            if item['type'] == 'blob':
-                if item['path'].lower() == pattern_lower or item['path'].lower().endswith(f"/{pattern_lower}"):
-                    return item
+        suffix = f"/{pattern_lower}"
+        for path_lower, item in files_by_name.get(pattern_lower.rsplit('/', 1)[-1], ()):
+            if path_lower == pattern_lower or path_lower.endswith(suffix):
+                return item
         return None
 
-    # Helper to check folder exists
+    # Index every directory name that appears in a path
+    folder_names = set()
+    for path_lower, _ in lowered_tree:
+        folder_names.update(path_lower.split('/')[:-1])
+
+    # Helper to check folder exists (at any depth)
     def has_folder(folder_name: str) -> bool:
-        folder_lower = folder_name.lower()
-        for item in tree:
-            if item['type'] == 'tree' or '/' in item.get('path', ''):
-                path_lower = item['path'].lower()
-                if path_lower.startswith(f"{folder_lower}/") or f"/{folder_lower}/" in path_lower:
-                    return True
-        return False
+        return folder_name.lower() in folder_names
 
     # README (30 points)
     readme = find_file('README.md') or find_file('README') or find_file('readme.md')
@@ -710,14 +752,7 @@ def analyze_documentation(tree: List[Dict]) -> Dict[str, Any]:
         details['github_folder'] = {'exists': False, 'points': 0}
 
     # Rating
-    if score >= 80:
-        rating = "Excellent"
-    elif score >= 60:
-        rating = "Good"
-    elif score >= 40:
-        rating = "Fair"
-    else:
-        rating = "Poor"
+    rating = _lookup_tier(score, QUALITY_RATINGS, "Poor")
 
     return {
         'score': score,
@@ -731,135 +766,135 @@ def format_repo_response(repo_data: Dict[str, Any], file_analysis: Dict[str, Any
     if "error" in repo_data:
         return f"❌ Error: {repo_data['error']}"
 
-    response = f"# 📦 Repository: {repo_data['full_name']}\n\n"
+    parts = [f"# 📦 Repository: {repo_data['full_name']}\n\n"]
 
-    response += f"**Description:** {repo_data.get('description', 'No description')}\n\n"
+    parts.append(f"**Description:** {repo_data.get('description', 'No description')}\n\n")
 
-    response += f"📊 **Stats:**\n"
-    response += f"- ⭐ Stars: {repo_data.get('stars', 0)}\n"
-    response += f"- 🍴 Forks: {repo_data.get('forks', 0)}\n"
-    response += f"- 🐛 Open Issues: {repo_data.get('open_issues', 0)}\n"
-    response += f"- 📁 Files: {file_analysis.get('file_count', 0)}\n"
-    response += f"- 💾 Size: {repo_data.get('size', 0)} KB\n"
+    parts.append(f"📊 **Stats:**\n")
+    parts.append(f"- ⭐ Stars: {repo_data.get('stars', 0)}\n")
+    parts.append(f"- 🍴 Forks: {repo_data.get('forks', 0)}\n")
+    parts.append(f"- 🐛 Open Issues: {repo_data.get('open_issues', 0)}\n")
+    parts.append(f"- 📁 Files: {file_analysis.get('file_count', 0)}\n")
+    parts.append(f"- 💾 Size: {repo_data.get('size', 0)} KB\n")
 
     # Contributors info
     contributors_count = repo_data.get('contributors_count', 0)
     commit_activity = repo_data.get('commit_activity', [])
 
     if contributors_count > 0:
-        response += f"- 👥 Contributors: {contributors_count}\n"
+        parts.append(f"- 👥 Contributors: {contributors_count}\n")
 
     if commit_activity and len(commit_activity) >= 12:
         recent_commits = commit_activity[-12:]  # Last 12 weeks
         avg_commits = sum(recent_commits) / 12
         total_commits_last_12w = sum(recent_commits)
-        response += f"- 📈 Recent Activity: {total_commits_last_12w} commits (last 12 weeks, avg {avg_commits:.1f}/week)\n"
+        parts.append(f"- 📈 Recent Activity: {total_commits_last_12w} commits (last 12 weeks, avg {avg_commits:.1f}/week)\n")
 
-    response += "\n"
+    parts.append("\n")
 
     # Languages
     if repo_data.get('languages'):
-        response += f"💻 **Languages:**\n"
+        parts.append(f"💻 **Languages:**\n")
         total_bytes = sum(repo_data['languages'].values())
         sorted_langs = sorted(repo_data['languages'].items(), key=lambda x: x[1], reverse=True)
         for lang, bytes_count in sorted_langs[:5]:
             percentage = (bytes_count / total_bytes * 100) if total_bytes > 0 else 0
-            response += f"- {lang}: {percentage:.1f}%\n"
-        response += "\n"
+            parts.append(f"- {lang}: {percentage:.1f}%\n")
+        parts.append("\n")
 
     # MeTTa insights
     insights = repo_data.get('metta_insights', {})
 
     if insights.get('complexity_tier'):
-        response += f"🔧 **Complexity:** {insights['complexity_tier'].replace('-', ' ').title()}\n"
+        parts.append(f"🔧 **Complexity:** {insights['complexity_tier'].replace('-', ' ').title()}\n")
 
     # Complexity Score (NEW - weighted)
     if insights.get('complexity_score'):
         complexity = insights['complexity_score']
-        tier_emoji = "🔥" if complexity['tier'] == "expert" else "⚡" if complexity['tier'] == "advanced" else "⭐" if complexity['tier'] == "intermediate" else "🌱"
+        tier_emoji = TIER_EMOJI.get(complexity['tier'], TIER_EMOJI["beginner"])
 
-        response += f"\n{tier_emoji} **Overall Complexity: {complexity['final_score']}/100** ({complexity['tier'].title()})\n"
-        response += f"  📊 **Score Breakdown:**\n"
+        parts.append(f"\n{tier_emoji} **Overall Complexity: {complexity['final_score']}/100** ({complexity['tier'].title()})\n")
+        parts.append(f"  📊 **Score Breakdown:**\n")
         breakdown = complexity['breakdown']
-        response += f"    • LOC: {breakdown['loc_score']:.1f}/100 (30% weight)\n"
-        response += f"    • Files: {breakdown['file_score']:.1f}/100 (25% weight)\n"
-        response += f"    • Tests: {breakdown['test_score']:.1f}/100 (20% weight)\n"
-        response += f"    • Docs: {breakdown['doc_score']:.1f}/100 (15% weight)\n"
-        response += f"    • Contributors: {breakdown['contributor_score']:.1f}/100 (10% weight)\n\n"
+        parts.append(f"    • LOC: {breakdown['loc_score']:.1f}/100 (30% weight)\n")
+        parts.append(f"    • Files: {breakdown['file_score']:.1f}/100 (25% weight)\n")
+        parts.append(f"    • Tests: {breakdown['test_score']:.1f}/100 (20% weight)\n")
+        parts.append(f"    • Docs: {breakdown['doc_score']:.1f}/100 (15% weight)\n")
+        parts.append(f"    • Contributors: {breakdown['contributor_score']:.1f}/100 (10% weight)\n\n")
 
     if insights.get('difficulty_tier'):
-        response += f"🎯 **Difficulty:** {insights['difficulty_tier'].title()}\n"
+        parts.append(f"🎯 **Difficulty:** {insights['difficulty_tier'].title()}\n")
 
     if insights.get('project_type'):
-        response += f"🏗️ **Project Type:** {insights['project_type'].replace('-', ' ').title()}\n\n"
+        parts.append(f"🏗️ **Project Type:** {insights['project_type'].replace('-', ' ').title()}\n\n")
 
     if insights.get('tech_domains'):
-        response += f"🧠 **Tech Domains:**\n"
+        parts.append(f"🧠 **Tech Domains:**\n")
         for domain in insights['tech_domains']:
-            response += f"- {domain.replace('-', ' ').title()}\n"
-        response += "\n"
+            parts.append(f"- {domain.replace('-', ' ').title()}\n")
+        parts.append("\n")
 
     # Documentation score
     if insights.get('documentation'):
         doc = insights['documentation']
-        doc_emoji = "📚" if doc['rating'] == "Excellent" else "📖" if doc['rating'] == "Good" else "📝" if doc['rating'] == "Fair" else "📄"
-        response += f"{doc_emoji} **Documentation:** {doc['rating']} ({doc['score']}/100)\n"
+        doc_emoji = DOC_RATING_EMOJI.get(doc['rating'], DOC_RATING_EMOJI["Poor"])
+        parts.append(f"{doc_emoji} **Documentation:** {doc['rating']} ({doc['score']}/100)\n")
 
         # Show key details
         details = doc.get('details', {})
         if details.get('readme', {}).get('exists'):
-            response += f"  ✅ README ({details['readme'].get('size_kb', 0)} KB)\n"
+            parts.append(f"  ✅ README ({details['readme'].get('size_kb', 0)} KB)\n")
         else:
-            response += f"  ❌ No README\n"
+            parts.append(f"  ❌ No README\n")
 
         if details.get('license', {}).get('exists'):
-            response += f"  ✅ LICENSE\n"
+            parts.append(f"  ✅ LICENSE\n")
         else:
-            response += f"  ❌ No LICENSE\n"
+            parts.append(f"  ❌ No LICENSE\n")
 
         if details.get('contributing', {}).get('exists'):
-            response += f"  ✅ CONTRIBUTING.md\n"
+            parts.append(f"  ✅ CONTRIBUTING.md\n")
 
         if details.get('docs_folder', {}).get('exists'):
-            response += f"  ✅ /docs/ folder\n"
+            parts.append(f"  ✅ /docs/ folder\n")
 
-        response += "\n"
+        parts.append("\n")
 
     # Test coverage
     if insights.get('test_coverage'):
         test = insights['test_coverage']
-        test_emoji = "🧪" if test['coverage_rating'] == "Excellent" else "🔬" if test['coverage_rating'] == "Good" else "⚗️" if test['coverage_rating'] == "Fair" else "🧫"
-        response += f"{test_emoji} **Test Coverage:** {test['coverage_rating']} ({test['coverage_score']}/100)\n"
+        test_emoji = TEST_RATING_EMOJI.get(test['coverage_rating'], TEST_RATING_EMOJI["Poor"])
+        parts.append(f"{test_emoji} **Test Coverage:** {test['coverage_rating']} ({test['coverage_score']}/100)\n")
 
-        response += f"  📊 Test Ratio: {test['test_ratio']:.1%} ({test['test_file_count']} test files / {test['code_file_count']} code files)\n"
+        parts.append(f"  📊 Test Ratio: {test['test_ratio']:.1%} ({test['test_file_count']} test files / {test['code_file_count']} code files)\n")
 
         if test.get('test_frameworks'):
-            response += f"  🛠️ Frameworks: {', '.join(test['test_frameworks'])}\n"
+            parts.append(f"  🛠️ Frameworks: {', '.join(test['test_frameworks'])}\n")
 
         if test.get('has_ci'):
             ci_count = len(test.get('ci_configs', []))
-            response += f"  ✅ CI/CD: {ci_count} configuration(s) found\n"
+            parts.append(f"  ✅ CI/CD: {ci_count} configuration(s) found\n")
         else:
-            response += f"  ❌ No CI/CD detected\n"
+            parts.append(f"  ❌ No CI/CD detected\n")
 
-        response += "\n"
+        parts.append("\n")
 
     # File structure
     if file_analysis.get('extensions'):
-        response += f"📂 **File Types:**\n"
+        parts.append(f"📂 **File Types:**\n")
         sorted_exts = sorted(file_analysis['extensions'].items(), key=lambda x: x[1], reverse=True)
         for ext, count in sorted_exts[:5]:
-            response += f"- .{ext}: {count} files\n"
-        response += "\n"
+            parts.append(f"- .{ext}: {count} files\n")
+        parts.append("\n")
 
     # MeTTa reasoning
     if insights.get('reasoning'):
-        response += "🧠 **MeTTa Reasoning:**\n"
+        parts.append("🧠 **MeTTa Reasoning:**\n")
         for reason in insights['reasoning']:
-            response += f"- {reason}\n"
-        response += "\n"
+            parts.append(f"- {reason}\n")
+        parts.append("\n")
 
-    response += f"🔗 [View Repository]({repo_data.get('repo_url', '')})\n\n"
-    response += f"_🔬 Analysis powered by MeTTa reasoning engine_"
+    parts.append(f"🔗 [View Repository]({repo_data.get('repo_url', '')})\n\n")
+    parts.append(f"_🔬 Analysis powered by MeTTa reasoning engine_")
 
-    return response
+    return "".join(parts)
@@ -5,12 +5,11 @@ Defines messages for requesting repository analysis from Repository Analyzer Age
 Used by other agents (Security, Matcher, Verifier) to get complexity metrics.
 """
 
+import asyncio
 from uagents import Context, Model, Protocol
-from typing import Dict, List, Optional
+from typing import List, Optional
 from metta.utils import fetch_github_repo, analyze_file_structure, analyze_with_metta
-from metta.reporag import RepoRAG
-from metta.knowledge import initialize_knowledge_graph
-from hyperon import MeTTa
+from metta.knowledge import get_rag
 
 
 class RepositoryAnalysisQuery(Model):
@@ -53,6 +52,9 @@ class RepositoryAnalysisResponse(Model):
 # Create protocol
 repository_proto = Protocol()
 
+# Shared knowledge graph (read-only, so one instance serves all requests)
+rag = get_rag()
+
 
 @repository_proto.on_message(model=RepositoryAnalysisQuery, replies=RepositoryAnalysisResponse)
 async def handle_repository_analysis(ctx: Context, sender: str, msg: RepositoryAnalysisQuery):
@@ -64,7 +66,7 @@ async def handle_repository_analysis(ctx: Context, sender: str, msg: RepositoryA
         sender: Address of requesting agent
         msg: RepositoryAnalysisQuery with repo_full_name
     """
-    ctx.logger.info(f"Received repository analysis request for: {msg.repo_full_name}")
+    ctx.logger.info("Received repository analysis request for: %s", msg.repo_full_name)
 
     try:
         # Parse owner/repo
@@ -81,8 +83,8 @@ async def handle_repository_analysis(ctx: Context, sender: str, msg: RepositoryA
 
         owner, repo = msg.repo_full_name.split("/", 1)
 
-        # Fetch repo data
-        repo_data = fetch_github_repo(owner, repo)
+        # Fetch repo data off the event loop so other requests keep being served
+        repo_data = await asyncio.to_thread(fetch_github_repo, owner, repo)
 
         if "error" in repo_data:
             await ctx.send(
@@ -99,12 +101,7 @@ async def handle_repository_analysis(ctx: Context, sender: str, msg: RepositoryA
         tree = repo_data.get('tree', [])
         file_analysis = analyze_file_structure(tree)
 
-        # Initialize MeTTa and load knowledge base
-        metta = MeTTa()
-        initialize_knowledge_graph(metta)
-
         # Analyze with MeTTa
-        rag = RepoRAG(metta)
         insights = analyze_with_metta(repo_data, file_analysis, rag)
 
         # Extract metrics
@@ -135,11 +132,11 @@ async def handle_repository_analysis(ctx: Context, sender: str, msg: RepositoryA
             has_ci=test_analysis.get('has_ci', False),
         )
 
-        ctx.logger.info(f"Sending analysis response for {msg.repo_full_name} (score: {response.complexity_score})")
+        ctx.logger.info("Sending analysis response for %s (score: %s)", msg.repo_full_name, response.complexity_score)
         await ctx.send(sender, response)
 
     except Exception as e:
-        ctx.logger.error(f"Error analyzing repository {msg.repo_full_name}: {e}")
+        ctx.logger.error("Error analyzing repository %s: %s", msg.repo_full_name, e)
         await ctx.send(
             sender,
             RepositoryAnalysisResponse(
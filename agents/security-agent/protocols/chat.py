@@ -5,8 +5,10 @@ Handles chat-based interactions with frontend/users via ASI-1.
 """
 
 from uagents import Context, Model, Protocol
-from typing import Optional
+from collections import Counter
 import re
+from utils.dependency_scanner import scan_dependencies
+from utils.osv_client import check_vulnerabilities
 
 # Chat models
 class ChatMessage(Model):
@@ -17,6 +19,12 @@ class ChatResponse(Model):
     """Response to user's chat message."""
     response: str
 
+# GitHub repo URL or owner/repo format, tried in order
+GITHUB_REPO_PATTERNS = (
+    re.compile(r'github\.com/([a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+)'),
+    re.compile(r'([a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+)'),
+)
+
 # Initialize protocol
 chat_proto = Protocol(name="AgentChatProtocol")
 
@@ -33,17 +41,12 @@ async def handle_chat(ctx: Context, sender: str, msg: ChatMessage):
     """
     user_message = msg.message.lower().strip()
 
-    ctx.logger.info(f"💬 Received chat message: {msg.message}")
+    ctx.logger.info("💬 Received chat message: %s", msg.message)
 
     # Extract GitHub repo URL or owner/repo format
-    github_patterns = [
-        r'github\.com/([a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+)',
-        r'([a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+)',
-    ]
-
     repo_full_name = None
-    for pattern in github_patterns:
-        match = re.search(pattern, msg.message)
+    for pattern in GITHUB_REPO_PATTERNS:
+        match = pattern.search(msg.message)
         if match:
             repo_full_name = match.group(1).rstrip('/')
             # Remove .git suffix if present
@@ -61,11 +64,7 @@ async def handle_chat(ctx: Context, sender: str, msg: ChatMessage):
         await ctx.send(sender, ChatResponse(response=response))
         return
 
-    ctx.logger.info(f"🔍 Scanning repository: {repo_full_name}")
-
-    # Import here to avoid circular imports
-    from utils.dependency_scanner import scan_dependencies
-    from utils.osv_client import check_vulnerabilities
+    ctx.logger.info("🔍 Scanning repository: %s", repo_full_name)
 
     try:
         # Split owner/repo
@@ -76,7 +75,7 @@ async def handle_chat(ctx: Context, sender: str, msg: ChatMessage):
         owner, repo = parts
 
         # Scan dependencies
-        ctx.logger.info(f"📦 Scanning dependencies for {owner}/{repo}...")
+        ctx.logger.info("📦 Scanning dependencies for %s/%s...", owner, repo)
         dep_result = await scan_dependencies(owner, repo)
 
         if not dep_result['success']:
@@ -85,7 +84,7 @@ async def handle_chat(ctx: Context, sender: str, msg: ChatMessage):
             return
 
         dependencies = dep_result['dependencies']
-        ctx.logger.info(f"📦 Found {len(dependencies)} dependencies")
+        ctx.logger.info("📦 Found %s dependencies", len(dependencies))
 
         if len(dependencies) == 0:
             response = (
@@ -98,15 +97,16 @@ async def handle_chat(ctx: Context, sender: str, msg: ChatMessage):
             return
 
         # Check vulnerabilities
-        ctx.logger.info(f"🔍 Checking vulnerabilities via OSV.dev...")
+        ctx.logger.info("🔍 Checking vulnerabilities via OSV.dev...")
         vulnerabilities = await check_vulnerabilities(dependencies)
 
         # Calculate stats
         total_vulns = len(vulnerabilities)
-        critical = sum(1 for v in vulnerabilities if v['severity'] == 'CRITICAL')
-        high = sum(1 for v in vulnerabilities if v['severity'] == 'HIGH')
-        medium = sum(1 for v in vulnerabilities if v['severity'] == 'MEDIUM')
-        low = sum(1 for v in vulnerabilities if v['severity'] == 'LOW')
+        severity_counts = Counter(v['severity'] for v in vulnerabilities)
+        critical = severity_counts['CRITICAL']
+        high = severity_counts['HIGH']
+        medium = severity_counts['MEDIUM']
+        low = severity_counts['LOW']
         unknown = total_vulns - (critical + high + medium + low)
 
         # Calculate security score (0-100)
@@ -132,40 +132,41 @@ async def handle_chat(ctx: Context, sender: str, msg: ChatMessage):
             tier_emoji = "🔴"
 
         # Build response
-        response = f"🔐 **Security Scan Complete: {repo_full_name}**\n\n"
-        response += f"📦 **Dependencies Scanned:** {len(dependencies)}\n\n"
+        parts = [f"🔐 **Security Scan Complete: {repo_full_name}**\n\n"]
+        parts.append(f"📦 **Dependencies Scanned:** {len(dependencies)}\n\n")
 
         if total_vulns > 0:
-            response += f"⚠️ **Vulnerabilities Found:** {total_vulns}\n"
-            response += f"   🔴 Critical: {critical}\n"
-            response += f"   🟠 High: {high}\n"
-            response += f"   🟡 Medium: {medium}\n"
-            response += f"   🟢 Low: {low}\n"
+            parts.append(f"⚠️ **Vulnerabilities Found:** {total_vulns}\n")
+            parts.append(f"   🔴 Critical: {critical}\n")
+            parts.append(f"   🟠 High: {high}\n")
+            parts.append(f"   🟡 Medium: {medium}\n")
+            parts.append(f"   🟢 Low: {low}\n")
             if unknown > 0:
-                response += f"   ⚪ Unknown: {unknown}\n"
-            response += f"\n"
+                parts.append(f"   ⚪ Unknown: {unknown}\n")
+            parts.append(f"\n")
 
             # Show top 5 vulnerabilities
-            response += f"📋 **Top Vulnerabilities:**\n"
+            parts.append(f"📋 **Top Vulnerabilities:**\n")
             for vuln in vulnerabilities[:5]:
-                response += f"\n• **{vuln['package']}** @ {vuln['version']}\n"
-                response += f"  Severity: {vuln['severity']}\n"
-                response += f"  ID: {vuln['id']}\n"
+                parts.append(f"\n• **{vuln['package']}** @ {vuln['version']}\n")
+                parts.append(f"  Severity: {vuln['severity']}\n")
+                parts.append(f"  ID: {vuln['id']}\n")
                 desc = vuln['description'][:100] + "..." if len(vuln['description']) > 100 else vuln['description']
-                response += f"  {desc}\n"
+                parts.append(f"  {desc}\n")
 
             if total_vulns > 5:
-                response += f"\n_...and {total_vulns - 5} more vulnerabilities_\n"
+                parts.append(f"\n_...and {total_vulns - 5} more vulnerabilities_\n")
         else:
-            response += f"✅ **No vulnerabilities found!**\n\n"
+            parts.append(f"✅ **No vulnerabilities found!**\n\n")
 
-        response += f"\n🛡️ **Security Score:** {score}/100\n"
-        response += f"📊 **Security Tier:** {tier_emoji} {tier}"
+        parts.append(f"\n🛡️ **Security Score:** {score}/100\n")
+        parts.append(f"📊 **Security Tier:** {tier_emoji} {tier}")
+        response = "".join(parts)
 
         await ctx.send(sender, ChatResponse(response=response))
-        ctx.logger.info(f"✅ Security scan complete for {repo_full_name}")
+        ctx.logger.info("✅ Security scan complete for %s", repo_full_name)
 
     except Exception as e:
-        ctx.logger.error(f"❌ Error scanning repository: {str(e)}")
+        ctx.logger.error("❌ Error scanning repository: %s", e)
         response = f"❌ Error scanning repository: {str(e)}"
         await ctx.send(sender, ChatResponse(response=response))
@@ -6,7 +6,8 @@ Used by Repository Analyzer and other agents to get vulnerability reports.
 """
 
 from uagents import Context, Model, Protocol
-from typing import List, Optional, Dict
+from collections import Counter
+from typing import List, Optional
 from utils.dependency_scanner import scan_dependencies
 from utils.osv_client import check_vulnerabilities
 
@@ -66,7 +67,7 @@ async def handle_security_scan(ctx: Context, sender: str, msg: SecurityScanQuery
         sender: Address of requesting agent
         msg: SecurityScanQuery with repo_full_name
     """
-    ctx.logger.info(f"Received security scan request for: {msg.repo_full_name}")
+    ctx.logger.info("Received security scan request for: %s", msg.repo_full_name)
 
     try:
         # Parse owner/repo
@@ -84,7 +85,7 @@ async def handle_security_scan(ctx: Context, sender: str, msg: SecurityScanQuery
         owner, repo = msg.repo_full_name.split("/", 1)
 
         # Scan dependencies
-        ctx.logger.info(f"Scanning dependencies for {msg.repo_full_name}...")
+        ctx.logger.info("Scanning dependencies for %s...", msg.repo_full_name)
         dependencies = await scan_dependencies(owner, repo)
 
         if not dependencies['success']:
@@ -99,14 +100,15 @@ async def handle_security_scan(ctx: Context, sender: str, msg: SecurityScanQuery
             return
 
         # Check vulnerabilities via OSV.dev
-        ctx.logger.info(f"Checking vulnerabilities for {len(dependencies['dependencies'])} packages...")
+        ctx.logger.info("Checking vulnerabilities for %s packages...", len(dependencies['dependencies']))
         vuln_results = await check_vulnerabilities(dependencies['dependencies'])
 
         # Count by severity
-        critical = sum(1 for v in vuln_results if v['severity'] == 'CRITICAL')
-        high = sum(1 for v in vuln_results if v['severity'] == 'HIGH')
-        medium = sum(1 for v in vuln_results if v['severity'] == 'MEDIUM')
-        low = sum(1 for v in vuln_results if v['severity'] == 'LOW')
+        severity_counts = Counter(v['severity'] for v in vuln_results)
+        critical = severity_counts['CRITICAL']
+        high = severity_counts['HIGH']
+        medium = severity_counts['MEDIUM']
+        low = severity_counts['LOW']
 
         total_vulns = len(vuln_results)
 
@@ -160,14 +162,14 @@ async def handle_security_scan(ctx: Context, sender: str, msg: SecurityScanQuery
         )
 
         ctx.logger.info(
-            f"Security scan complete: {total_vulns} vulnerabilities found "
-            f"(C:{critical}, H:{high}, M:{medium}, L:{low}), score: {score}/100"
+            "Security scan complete: %d vulnerabilities found (C:%d, H:%d, M:%d, L:%d), score: %d/100",
+            total_vulns, critical, high, medium, low, score
         )
 
         await ctx.send(sender, response)
 
     except Exception as e:
-        ctx.logger.error(f"Error scanning repository {msg.repo_full_name}: {e}")
+        ctx.logger.error("Error scanning repository %s: %s", msg.repo_full_name, e)
         await ctx.send(
             sender,
             SecurityScanResponse(
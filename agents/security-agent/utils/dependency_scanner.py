@@ -5,10 +5,18 @@ Scans GitHub repositories for dependency files and extracts package information.
 Supports: package.json, requirements.txt, go.mod, Cargo.toml, pom.xml, Gemfile
 """
 
+import asyncio
 import requests
 import json
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+# One keep-alive session for the GitHub API and raw.githubusercontent.com
+_github_session = requests.Session()
+_github_session.headers.update({"Accept": "application/vnd.github.v3+json"})
+
+# requirements.txt pin: package==1.0.0 or package>=1.0.0
+REQUIREMENT_PATTERN = re.compile(r'([a-zA-Z0-9_\-\.]+)([><=!]+)([0-9\.]+)')
 
 
 async def scan_dependencies(owner: str, repo: str) -> Dict:
@@ -29,17 +37,19 @@ async def scan_dependencies(owner: str, repo: str) -> Dict:
     """
     try:
         # Fetch repository tree
-        tree_response = requests.get(
+        branch = 'main'
+        tree_response = await asyncio.to_thread(
+            _github_session.get,
             f"https://api.github.com/repos/{owner}/{repo}/git/trees/main?recursive=1",
-            headers={"Accept": "application/vnd.github.v3+json"},
             timeout=10
         )
 
         if tree_response.status_code == 404:
             # Try 'master' branch
-            tree_response = requests.get(
+            branch = 'master'
+            tree_response = await asyncio.to_thread(
+                _github_session.get,
                 f"https://api.github.com/repos/{owner}/{repo}/git/trees/master?recursive=1",
-                headers={"Accept": "application/vnd.github.v3+json"},
                 timeout=10
             )
 
@@ -67,28 +77,13 @@ async def scan_dependencies(owner: str, repo: str) -> Dict:
                 if filename in dependency_files:
                     dependency_files[filename] = item['path']
 
-        # Extract dependencies from each file
-        all_dependencies = []
-
-        # package.json (npm)
-        if dependency_files['package.json']:
-            deps = await parse_package_json(owner, repo, dependency_files['package.json'])
-            all_dependencies.extend(deps)
-
-        # requirements.txt (Python)
-        if dependency_files['requirements.txt']:
-            deps = await parse_requirements_txt(owner, repo, dependency_files['requirements.txt'])
-            all_dependencies.extend(deps)
-
-        # go.mod (Go)
-        if dependency_files['go.mod']:
-            deps = await parse_go_mod(owner, repo, dependency_files['go.mod'])
-            all_dependencies.extend(deps)
-
-        # Cargo.toml (Rust)
-        if dependency_files['Cargo.toml']:
-            deps = await parse_cargo_toml(owner, repo, dependency_files['Cargo.toml'])
-            all_dependencies.extend(deps)
+        # Extract dependencies from each file that has a parser, fetching the files concurrently
+        parsed = await asyncio.gather(*(
+            parse(owner, repo, dependency_files[filename], branch)
+            for filename, parse in DEPENDENCY_PARSERS.items()
+            if dependency_files[filename]
+        ))
+        all_dependencies = [dep for deps in parsed for dep in deps]
 
         return {
             'success': True,
@@ -103,24 +98,27 @@ async def scan_dependencies(owner: str, repo: str) -> Dict:
         }
 
 
-async def parse_package_json(owner: str, repo: str, path: str) -> List[Dict]:
-    """Extract dependencies from package.json."""
-    try:
-        response = requests.get(
-            f"https://raw.githubusercontent.com/{owner}/{repo}/main/{path}",
-            timeout=10
-        )
+def fetch_raw_file(owner: str, repo: str, branch: str, path: str) -> Optional[str]:
+    """Fetch a file's raw contents from the given branch, or None if unavailable."""
+    response = _github_session.get(
+        f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}",
+        timeout=10
+    )
+
+    if response.status_code != 200:
+        return None
+
+    return response.text
 
-        if response.status_code == 404:
-            response = requests.get(
-                f"https://raw.githubusercontent.com/{owner}/{repo}/master/{path}",
-                timeout=10
-            )
 
-        if response.status_code != 200:
+async def parse_package_json(owner: str, repo: str, path: str, branch: str = 'main') -> List[Dict]:
+    """Extract dependencies from package.json."""
+    try:
+        content = await asyncio.to_thread(fetch_raw_file, owner, repo, branch, path)
+        if content is None:
             return []
 
-        data = json.loads(response.text)
+        data = json.loads(content)
         dependencies = []
 
         # Runtime dependencies
@@ -145,30 +143,20 @@ async def parse_package_json(owner: str, repo: str, path: str) -> List[Dict]:
         return []
 
 
-async def parse_requirements_txt(owner: str, repo: str, path: str) -> List[Dict]:
+async def parse_requirements_txt(owner: str, repo: str, path: str, branch: str = 'main') -> List[Dict]:
     """Extract dependencies from requirements.txt."""
     try:
-        response = requests.get(
-            f"https://raw.githubusercontent.com/{owner}/{repo}/main/{path}",
-            timeout=10
-        )
-
-        if response.status_code == 404:
-            response = requests.get(
-                f"https://raw.githubusercontent.com/{owner}/{repo}/master/{path}",
-                timeout=10
-            )
-
-        if response.status_code != 200:
+        content = await asyncio.to_thread(fetch_raw_file, owner, repo, branch, path)
+        if content is None:
             return []
 
         dependencies = []
 
-        for line in response.text.split('\n'):
+        for line in content.split('\n'):
             line = line.strip()
             if line and not line.startswith('#'):
                 # Parse: package==1.0.0 or package>=1.0.0
-                match = re.match(r'([a-zA-Z0-9_\-\.]+)([><=!]+)([0-9\.]+)', line)
+                match = REQUIREMENT_PATTERN.match(line)
                 if match:
                     dependencies.append({
                         'package': match.group(1),
@@ -189,27 +177,17 @@ async def parse_requirements_txt(owner: str, repo: str, path: str) -> List[Dict]
         return []
 
 
-async def parse_go_mod(owner: str, repo: str, path: str) -> List[Dict]:
+async def parse_go_mod(owner: str, repo: str, path: str, branch: str = 'main') -> List[Dict]:
     """Extract dependencies from go.mod."""
     try:
-        response = requests.get(
-            f"https://raw.githubusercontent.com/{owner}/{repo}/main/{path}",
-            timeout=10
-        )
-
-        if response.status_code == 404:
-            response = requests.get(
-                f"https://raw.githubusercontent.com/{owner}/{repo}/master/{path}",
-                timeout=10
-            )
-
-        if response.status_code != 200:
+        content = await asyncio.to_thread(fetch_raw_file, owner, repo, branch, path)
+        if content is None:
             return []
 
         dependencies = []
         in_require_block = False
 
-        for line in response.text.split('\n'):
+        for line in content.split('\n'):
             line = line.strip()
 
             if line.startswith('require ('):
@@ -234,27 +212,17 @@ async def parse_go_mod(owner: str, repo: str, path: str) -> List[Dict]:
         return []
 
 
-async def parse_cargo_toml(owner: str, repo: str, path: str) -> List[Dict]:
+async def parse_cargo_toml(owner: str, repo: str, path: str, branch: str = 'main') -> List[Dict]:
     """Extract dependencies from Cargo.toml."""
     try:
-        response = requests.get(
-            f"https://raw.githubusercontent.com/{owner}/{repo}/main/{path}",
-            timeout=10
-        )
-
-        if response.status_code == 404:
-            response = requests.get(
-                f"https://raw.githubusercontent.com/{owner}/{repo}/master/{path}",
-                timeout=10
-            )
-
-        if response.status_code != 200:
+        content = await asyncio.to_thread(fetch_raw_file, owner, repo, branch, path)
+        if content is None:
             return []
 
         dependencies = []
         in_dependencies = False
 
-        for line in response.text.split('\n'):
+        for line in content.split('\n'):
             line = line.strip()
 
             if line == '[dependencies]':
@@ -279,3 +247,12 @@ async def parse_cargo_toml(owner: str, repo: str, path: str) -> List[Dict]:
 
     except Exception:
         return []
+
+
+# Dependency file name → parser (pom.xml and Gemfile are detected but not parsed yet)
+DEPENDENCY_PARSERS = {
+    'package.json': parse_package_json,  # npm
+    'requirements.txt': parse_requirements_txt,  # Python
+    'go.mod': parse_go_mod,  # Go
+    'Cargo.toml': parse_cargo_toml,  # Rust
+}
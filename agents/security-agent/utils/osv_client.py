@@ -5,8 +5,27 @@ Queries OSV.dev (Open Source Vulnerabilities) database for security advisories.
 API Docs: https://google.github.io/osv.dev/api/
 """
 
+import asyncio
+import logging
+import time
 import requests
-from typing import List, Dict
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# One keep-alive session for all OSV.dev calls (a scan makes up to 51). Queries run
+# concurrently on the default executor (at most 32 threads), so size the pool to match
+# instead of requests' default of 10 kept-alive connections.
+_osv_session = requests.Session()
+_osv_session.mount("https://", HTTPAdapter(pool_maxsize=32))
+
+# Recent OSV answers: (package, version, ecosystem) → (fetched_at, vulnerabilities),
+# least recently used first
+OSV_CACHE_TTL_SECONDS = 3600
+OSV_CACHE_MAX_ENTRIES = 4096
+_osv_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, List[Dict]]]" = OrderedDict()
 
 
 async def check_vulnerabilities(dependencies: List[Dict]) -> List[Dict]:
@@ -21,20 +40,37 @@ async def check_vulnerabilities(dependencies: List[Dict]) -> List[Dict]:
     """
     vulnerabilities = []
 
-    for dep in dependencies[:50]:  # Limit to 50 to avoid rate limits
-        try:
-            vulns = await query_osv(dep['package'], dep['version'], dep['ecosystem'])
-            vulnerabilities.extend(vulns)
-        except Exception as e:
-            print(f"Error checking {dep['package']}: {e}")
+    # Order-preserving dedupe: a package can be listed twice (e.g. dependencies and devDependencies)
+    unique_dependencies = list(dict.fromkeys(
+        (dep['package'], dep['version'], dep['ecosystem']) for dep in dependencies
+    ))
+
+    unique_dependencies = unique_dependencies[:50]  # Limit to 50 to avoid rate limits
+
+    # Most packages have no advisories; one batch request rules them out up front
+    await _cache_unaffected_packages(unique_dependencies)
+
+    # Query concurrently; gather keeps results in dependency order
+    results = await asyncio.gather(
+        *(query_osv(package, version, ecosystem) for package, version, ecosystem in unique_dependencies),
+        return_exceptions=True
+    )
+
+    for (package, _, _), vulns in zip(unique_dependencies, results):
+        if isinstance(vulns, Exception):
+            logger.error("Error checking %s: %s", package, vulns)
             continue
+        vulnerabilities.extend(vulns)
 
     return vulnerabilities
 
 
 async def query_osv(package: str, version: str, ecosystem: str) -> List[Dict]:
     """
-    Query OSV.dev API for a specific package/version.
+    Query OSV.dev API for a specific package/version, reusing a recent answer.
+
+    Pinned versions are shared by most scanned repos and advisories change
+    slowly, so repeated scans skip the network. Failed queries are never cached.
 
     Args:
         package: Package name
@@ -44,8 +80,84 @@ async def query_osv(package: str, version: str, ecosystem: str) -> List[Dict]:
     Returns:
         List of vulnerability details
     """
+    cache_key = (package, version, ecosystem)
+    cached = _get_cached(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    results = await _query_osv_uncached(package, version, ecosystem)
+    if results is None:
+        return []
+
+    _store_cached(cache_key, results, time.monotonic())
+    return list(results)
+
+
+def _get_cached(cache_key: Tuple[str, str, str]) -> Optional[List[Dict]]:
+    """Return a cached OSV answer that is still fresh, else None."""
+    cached = _osv_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < OSV_CACHE_TTL_SECONDS:
+        _osv_cache.move_to_end(cache_key)
+        return cached[1]
+    return None
+
+
+def _store_cached(cache_key: Tuple[str, str, str], vulns: List[Dict], fetched_at: float) -> None:
+    """Cache an OSV answer, evicting the least recently used one past the size cap."""
+    _osv_cache[cache_key] = (fetched_at, vulns)
+    _osv_cache.move_to_end(cache_key)
+    if len(_osv_cache) > OSV_CACHE_MAX_ENTRIES:
+        _osv_cache.popitem(last=False)
+
+
+async def _cache_unaffected_packages(dependencies: List[Tuple[str, str, str]]) -> None:
+    """
+    Cache an empty answer for every uncached dependency OSV reports no advisories for.
+
+    /v1/querybatch only returns advisory IDs, so affected packages still get a
+    full /v1/query for details. On any failure nothing is cached and every
+    package falls back to its own query.
+    """
+    uncached = [key for key in dependencies if _get_cached(key) is None]
+    if not uncached:
+        return
+
+    try:
+        response = await asyncio.to_thread(
+            _osv_session.post,
+            "https://api.osv.dev/v1/querybatch",
+            json={
+                "queries": [
+                    {"package": {"name": package, "ecosystem": ecosystem}, "version": version}
+                    for package, version, ecosystem in uncached
+                ]
+            },
+            timeout=10
+        )
+
+        if response.status_code != 200:
+            return
+
+        batch_results = response.json().get('results', [])
+    except Exception as e:
+        logger.error("OSV batch query error: %s", e)
+        return
+
+    if len(batch_results) != len(uncached):
+        return
+
+    now = time.monotonic()
+    for cache_key, result in zip(uncached, batch_results):
+        if not result.get('vulns'):
+            _store_cached(cache_key, [], now)
+
+
+async def _query_osv_uncached(package: str, version: str, ecosystem: str) -> Optional[List[Dict]]:
+    """Query OSV.dev API; returns None when the query failed."""
     try:
-        response = requests.post(
+        # requests is blocking; run it in a worker thread so queries overlap
+        response = await asyncio.to_thread(
+            _osv_session.post,
             "https://api.osv.dev/v1/query",
             json={
                 "package": {
@@ -58,7 +170,7 @@ async def query_osv(package: str, version: str, ecosystem: str) -> List[Dict]:
         )
 
         if response.status_code != 200:
-            return []
+            return None
 
         data = response.json()
         vulns = data.get('vulns', [])
@@ -86,17 +198,23 @@ async def query_osv(package: str, version: str, ecosystem: str) -> List[Dict]:
                                         fixed_version = event['fixed']
                                         break
 
+            # Only slice the long-form details when there is no summary
+            if 'summary' in vuln:
+                description = vuln['summary']
+            else:
+                description = vuln.get('details', 'No description')[:200]
+
             results.append({
                 'package': package,
                 'version': version,
                 'id': vuln.get('id', 'UNKNOWN'),
                 'severity': severity.upper(),
-                'description': vuln.get('summary', vuln.get('details', 'No description')[:200]),
+                'description': description,
                 'fixed_version': fixed_version
             })
 
         return results
 
     except Exception as e:
-        print(f"OSV API error for {package}: {e}")
-        return []
+        logger.error("OSV API error for %s: %s", package, e)
+        return None